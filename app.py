@@ -1,6 +1,12 @@
 import os
+import time
+import atexit
+import threading
 import requests
 import base64
+import json
+import string
+from collections import OrderedDict, deque
 from flask import Flask, request
 from dotenv import load_dotenv
 
@@ -17,69 +23,446 @@ TELEGRAM_API_URL = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}"
 SUPABASE_API_URL = f"{SUPABASE_URL}/rest/v1"
 
 
-def send_telegram_message(chat_id, text):
-    url = f"{TELEGRAM_API_URL}/sendMessage"
-    payload = {
-        "chat_id": chat_id,
-        "text": text,
-        "parse_mode": "Markdown"
-    }
-    requests.post(url, json=payload)
+# Telegram flood limits: ~30 messages/s overall and ~1 message/s per chat
+GLOBAL_SEND_RATE = 30
+PER_CHAT_SEND_INTERVAL = 1.0
+MAX_SEND_ATTEMPTS = 5
+SENDER_THREADS = 8
+# Telegram stops accepting a callback answer a few seconds after the click
+CALLBACK_ANSWER_TTL = 10
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class TokenBucket:
+    """Simple token bucket refilled continuously at `rate` tokens per second."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now):
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class SendJob:
+    """A single outbound Telegram API call waiting in the scheduler."""
+
+    def __init__(self, method, payload, chat_id=None, status=None, ttl=None):
+        self.method = method
+        # Either a dict, or bytes already JSON-encoded by the message catalog
+        self.payload = payload
+        self.chat_id = chat_id
+        # Shared status-message state when this job sends or edits a status line
+        self.status = status
+        self.attempts = 0
+        self.sent = False
+        # Earliest retry time, and the point after which the job is dropped
+        self.ready_at = 0
+        self.expires_at = time.monotonic() + ttl if ttl is not None else None
+
+
+class TelegramSendScheduler:
+    """Background sender honouring Telegram's per-chat and global flood limits.
+
+    Messages are queued per chat and drained round-robin by a small pool of
+    sender threads, with at most one call in flight per chat so each chat's
+    messages stay in order. Callback answers skip the per-chat queues, are
+    sent first and are dropped once Telegram would no longer accept them. A
+    429 reply puts the job back at the head of its queue until `retry_after`
+    expires. Consecutive status messages ("Génération en cours",
+    "Téléchargement") for a chat are coalesced into a single message that
+    gets edited.
+    """
+
+    def __init__(self, global_rate=GLOBAL_SEND_RATE, chat_interval=PER_CHAT_SEND_INTERVAL,
+                 threads=SENDER_THREADS):
+        self.bucket = TokenBucket(global_rate, global_rate)
+        self.chat_interval = chat_interval
+        self.threads = threads
+        self.priority = deque()
+        self.chats = OrderedDict()
+        self.chat_ready_at = {}
+        self.in_flight = set()
+        self.statuses = {}
+        self.global_ready_at = 0
+        self.cond = threading.Condition()
+        self.workers = []
+        self.stopping = False
+
+    def start(self):
+        with self.cond:
+            if not self.workers:
+                for i in range(self.threads):
+                    worker = threading.Thread(target=self._run, name=f"telegram-sender-{i}", daemon=True)
+                    worker.start()
+                    self.workers.append(worker)
+
+    def stop(self, timeout=10):
+        """Flush pending jobs (up to `timeout` seconds) and stop the workers."""
+        with self.cond:
+            self.stopping = True
+            self.cond.notify_all()
+        deadline = time.monotonic() + timeout
+        for worker in self.workers:
+            worker.join(max(0, deadline - time.monotonic()))
+
+    def enqueue(self, method, payload, chat_id=None, priority=False, ttl=None):
+        job = SendJob(method, payload, chat_id, ttl=ttl)
+        with self.cond:
+            if priority or chat_id is None:
+                self.priority.append(job)
+            else:
+                # A regular message ends the current status line for this chat
+                self.statuses.pop(chat_id, None)
+                self.chats.setdefault(chat_id, deque()).append(job)
+            self.cond.notify()
+        self.start()
+
+    def enqueue_status(self, chat_id, text):
+        """Send or update the chat's status line instead of stacking messages."""
+        with self.cond:
+            status = self.statuses.get(chat_id)
+            if status is not None and not status["job"].sent:
+                # Still queued: just swap the text before it goes out
+                status["job"].payload["text"] = text
+            elif status is not None:
+                job = SendJob("editMessageText", {"chat_id": chat_id, "text": text, "parse_mode": "Markdown"}, chat_id, status)
+                status["job"] = job
+                self.chats.setdefault(chat_id, deque()).append(job)
+            else:
+                status = {"message_id": None}
+                job = SendJob("sendMessage", {"chat_id": chat_id, "text": text, "parse_mode": "Markdown"}, chat_id, status)
+                status["job"] = job
+                self.statuses[chat_id] = status
+                self.chats.setdefault(chat_id, deque()).append(job)
+            self.cond.notify()
+        self.start()
+
+    def _next_job(self, now):
+        """Pop the next sendable job, or return the seconds to wait for one."""
+        wait = max(self.bucket.wait_time(now), self.global_ready_at - now)
+        if wait > 0:
+            return None, wait
+        wait = None
+        for job in list(self.priority):
+            if job.expires_at is not None and job.expires_at <= now:
+                print(f"Telegram {job.method} expired before it could be sent")
+                self.priority.remove(job)
+            elif job.ready_at <= now:
+                self.priority.remove(job)
+                return job, 0
+            else:
+                wait = job.ready_at - now if wait is None else min(wait, job.ready_at - now)
+        for chat_id in list(self.chats):
+            if chat_id in self.in_flight:
+                continue
+            ready_at = self.chat_ready_at.get(chat_id, 0)
+            if ready_at <= now:
+                queue = self.chats.pop(chat_id)
+                job = queue.popleft()
+                if queue:
+                    # Re-insert at the end so chats are served round-robin
+                    self.chats[chat_id] = queue
+                return job, 0
+            wait = ready_at - now if wait is None else min(wait, ready_at - now)
+        return None, wait
+
+    def _requeue(self, job, delay, flood):
+        now = time.monotonic()
+        if job.expires_at is not None and now + delay > job.expires_at:
+            print(f"Telegram {job.method} dropped, retry would come too late")
+            return
+        if job.chat_id is None:
+            if flood:
+                self.global_ready_at = max(self.global_ready_at, now + delay)
+            job.ready_at = now + delay
+            self.priority.appendleft(job)
+            return
+        self.chat_ready_at[job.chat_id] = max(self.chat_ready_at.get(job.chat_id, 0), now + delay)
+        queue = self.chats.pop(job.chat_id, deque())
+        queue.appendleft(job)
+        # Put the chat back at the front so its order is preserved
+        self.chats[job.chat_id] = queue
+        self.chats.move_to_end(job.chat_id, last=False)
+
+    def _prune_chats(self):
+        """Forget rate-limit state for idle chats so it doesn't grow forever."""
+        now = time.monotonic()
+        for chat_id, ready_at in list(self.chat_ready_at.items()):
+            if ready_at <= now and chat_id not in self.chats:
+                del self.chat_ready_at[chat_id]
+
+    def _dispatch(self, job):
+        """Mark a job as in flight and return the payload to send (lock held)."""
+        now = time.monotonic()
+        self.bucket.consume(now)
+        if job.chat_id is not None:
+            self.in_flight.add(job.chat_id)
+            self.chat_ready_at[job.chat_id] = now + self.chat_interval
+            if len(self.chat_ready_at) > 1000:
+                self._prune_chats()
+        if job.status is not None and job.method == "editMessageText":
+            if job.status["message_id"] is None:
+                # The original status message never made it, send a fresh one
+                job.method = "sendMessage"
+                job.payload.pop("message_id", None)
+            else:
+                job.payload["message_id"] = job.status["message_id"]
+        job.sent = True
+        return dict(job.payload) if isinstance(job.payload, dict) else job.payload
+
+    def _complete(self, job, delay, flood):
+        """Requeue a job that needs a retry and release its chat (lock held)."""
+        if delay is not None:
+            job.sent = False
+            self._requeue(job, delay, flood)
+        self.in_flight.discard(job.chat_id)
+        self.cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self.cond:
+                if self.stopping and not self.priority and not self.chats:
+                    return
+                job, wait = self._next_job(time.monotonic())
+                if job is None:
+                    self.cond.wait(wait)
+                    continue
+                payload = self._dispatch(job)
+
+            delay, flood = self._send(job, payload)
+
+            with self.cond:
+                self._complete(job, delay, flood)
+
+    def _send(self, job, payload):
+        """Perform the API call.
+
+        Returns `(delay, flood)`: the retry delay (None when done) and whether
+        it comes from a 429 `retry_after`.
+        """
+        job.attempts += 1
+        try:
+            url = f"{TELEGRAM_API_URL}/{job.method}"
+            if isinstance(payload, bytes):
+                # Already JSON-encoded by the message catalog
+                response = requests.post(url, data=payload, headers=JSON_HEADERS, timeout=30)
+            else:
+                response = requests.post(url, json=payload, timeout=30)
+        except Exception as e:
+            print(f"Telegram {job.method} error: {e}")
+            if job.attempts < MAX_SEND_ATTEMPTS:
+                return 2 ** job.attempts, False
+            print(f"Telegram {job.method} dropped after {job.attempts} attempts")
+            return None, False
+
+        print(f"Telegram {job.method} response: {response.status_code}")
+        if response.status_code == 200:
+            if job.status is not None and job.method == "sendMessage":
+                try:
+                    job.status["message_id"] = response.json()["result"]["message_id"]
+                except Exception:
+                    pass
+            return None, False
+
+        if response.status_code == 429:
+            # Flood control never counts as a failed attempt
+            job.attempts -= 1
+            try:
+                retry_after = response.json()["parameters"]["retry_after"]
+            except Exception:
+                retry_after = 1
+            print(f"Telegram flood limit hit, retrying {job.method} in {retry_after}s")
+            return retry_after, True
+
+        if response.status_code >= 500 and job.attempts < MAX_SEND_ATTEMPTS:
+            return 2 ** job.attempts, False
+
+        print(f"Telegram {job.method} failed: {response.text[:200]}")
+        return None, False
+
+
+sender = TelegramSendScheduler()
+atexit.register(sender.stop)
+
+
+# The bot has always replied in French, so that stays the fallback
+DEFAULT_LANGUAGE = "fr"
+
+MESSAGES = {
+    "fr": {
+        "account_created": "✨ *Compte créé !*\n\nTu as reçu *3 crédits gratuits* pour générer des images IA.",
+        "menu": "👋 Bienvenue sur GeminiArtBot ! Que veux-tu faire ?",
+        "menu_prompt_text": "✍️ Prompt texte",
+        "menu_prompt_photo": "📸 Photo",
+        "menu_check_credits": "🎁 Crédits",
+        "menu_buy_credits": "💳 Acheter",
+        "menu_about_bot": "ℹ️ À propos",
+        "prompt_text": "✍️ Envoie-moi ton prompt texte !",
+        "prompt_photo": "📸 Envoie-moi une photo maintenant.",
+        "check_credits": "🎁 Tu as *{credits} crédit(s)* disponibles.",
+        "credits": "💳 Tu as *{credits} crédits* disponibles.",
+        "buy_credits": "💳 Paiement bientôt disponible via Stripe/Telegram.",
+        "about_bot": (
+            "🤖 *GeminiArtBot* est un générateur d'images IA propulsé par Gemini 2.5 Flash et OpenRouter.\n\n"
+            "✨ Envoie un prompt texte pour générer une image !\n\n"
+            "💡 Chaque génération coûte 1 crédit."
+        ),
+        "account_error": "❌ Erreur de création du compte. Réessaie plus tard.",
+        "register_first": "❌ Utilise /start pour t'inscrire d'abord.",
+        "no_credits": "⚠️ Tu n'as plus de crédits!",
+        "generating": "🎨 Génération en cours...",
+        "downloading": "📥 Téléchargement de l'image...",
+        "generated": "✅ Image générée!\n\n💳 Crédits restants: *{credits}*",
+        "download_error": "❌ Erreur lors du téléchargement de l'image. Réessaie plus tard.",
+        "unsupported_format": "❌ Le format de l'image générée n'est pas supporté pour le moment.",
+        "generation_error": "❌ Erreur lors de la génération. Réessaie avec un prompt différent.",
+    },
+    "en": {
+        "account_created": "✨ *Account created!*\n\nYou received *3 free credits* to generate AI images.",
+        "menu": "👋 Welcome to GeminiArtBot! What would you like to do?",
+        "menu_prompt_text": "✍️ Text prompt",
+        "menu_prompt_photo": "📸 Photo",
+        "menu_check_credits": "🎁 Credits",
+        "menu_buy_credits": "💳 Buy",
+        "menu_about_bot": "ℹ️ About",
+        "prompt_text": "✍️ Send me your text prompt!",
+        "prompt_photo": "📸 Send me a photo now.",
+        "check_credits": "🎁 You have *{credits} credit(s)* available.",
+        "credits": "💳 You have *{credits} credits* available.",
+        "buy_credits": "💳 Payment coming soon via Stripe/Telegram.",
+        "about_bot": (
+            "🤖 *GeminiArtBot* is an AI image generator powered by Gemini 2.5 Flash and OpenRouter.\n\n"
+            "✨ Send a text prompt to generate an image!\n\n"
+            "💡 Each generation costs 1 credit."
+        ),
+        "account_error": "❌ Account creation failed. Please try again later.",
+        "register_first": "❌ Use /start to sign up first.",
+        "no_credits": "⚠️ You have no credits left!",
+        "generating": "🎨 Generating...",
+        "downloading": "📥 Downloading the image...",
+        "generated": "✅ Image generated!\n\n💳 Credits left: *{credits}*",
+        "download_error": "❌ Error while downloading the image. Please try again later.",
+        "unsupported_format": "❌ The generated image format is not supported yet.",
+        "generation_error": "❌ Generation failed. Try again with a different prompt.",
+    },
+}
+
+# Messages written with Markdown (*bold*); the rest are sent as plain text
+MARKDOWN_MESSAGES = {"account_created", "check_credits", "credits", "about_bot"}
+
+# Callback buttons of the main menu, one inner list per keyboard row
+MENU_LAYOUT = [
+    ["prompt_text", "prompt_photo"],
+    ["check_credits", "buy_credits"],
+    ["about_bot"],
+]
+
+
+def resolve_language(telegram_user):
+    """Pick the reply language from the sender's Telegram language_code.
+
+    Every update carries it, so static replies need no database lookup. The
+    stored `users.language` is not used: rows created before the catalog
+    were all hardcoded to 'en' and say nothing about the user's preference.
+    """
+    language = (telegram_user.get("language_code") or "")[:2].lower()
+    return language if language in MESSAGES else DEFAULT_LANGUAGE
+
+
+class MessageCatalog:
+    """Localized sendMessage bodies, JSON-encoded once at startup.
+
+    Each message is stored as a list alternating static byte chunks and the
+    names of its dynamic fields (always `chat_id`, plus e.g. `credits`), so
+    rendering only has to join bytes. Dynamic values must be numbers.
+    """
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.templates = {}
+        for language, texts in messages.items():
+            for key in texts:
+                if key.startswith("menu_"):
+                    continue
+                payload = {"chat_id": "@@chat_id@@", "text": self._mark_fields(texts[key])}
+                if key in MARKDOWN_MESSAGES:
+                    payload["parse_mode"] = "Markdown"
+                if key == "menu":
+                    payload["reply_markup"] = {
+                        "inline_keyboard": [
+                            [{"text": texts[f"menu_{action}"], "callback_data": action} for action in row]
+                            for row in MENU_LAYOUT
+                        ]
+                    }
+                self.templates[(language, key)] = self._compile(json.dumps(payload, ensure_ascii=False))
+
+    @staticmethod
+    def _mark_fields(text):
+        fields = [name for _, name, _, _ in string.Formatter().parse(text) if name]
+        return text.format(**{name: f"@@{name}@@" for name in fields})
+
+    @staticmethod
+    def _compile(body):
+        # chat_id is an unquoted JSON number, the other markers sit inside strings
+        body = body.replace('"@@chat_id@@"', "@@chat_id@@")
+        parts = body.split("@@")
+        return [part.encode() if i % 2 == 0 else part for i, part in enumerate(parts)]
+
+    def text(self, key, language=DEFAULT_LANGUAGE, **fields):
+        text = self.messages.get(language, self.messages[DEFAULT_LANGUAGE])[key]
+        return text.format(**fields) if fields else text
+
+    def render(self, key, language, chat_id, **fields):
+        template = self.templates.get((language, key)) or self.templates[(DEFAULT_LANGUAGE, key)]
+        fields["chat_id"] = chat_id
+        return b"".join(part if i % 2 == 0 else str(fields[part]).encode() for i, part in enumerate(template))
+
+
+catalog = MessageCatalog(MESSAGES)
+
+
+def send_catalog_message(chat_id, key, language=DEFAULT_LANGUAGE, **fields):
+    """Send a message from the catalog, filling only its dynamic fields."""
+    sender.enqueue("sendMessage", catalog.render(key, language, chat_id, **fields), chat_id)
+
+
+def send_status_message(chat_id, text):
+    """Show a transient status line, editing the previous one when possible."""
+    sender.enqueue_status(chat_id, text)
 
 
 def send_telegram_photo(chat_id, photo_data, caption=""):
     """Send photo to Telegram. photo_data can be either a URL or base64 encoded image data"""
-    url = f"{TELEGRAM_API_URL}/sendPhoto"
-    
-    # Check if photo_data is base64 (starts with data:image) or a URL
-    if photo_data.startswith('data:image'):
-        # It's base64 data, send as document with photo parameter
-        payload = {
-            "chat_id": chat_id,
-            "photo": photo_data,
-            "caption": caption
-        }
-    else:
-        # It's a URL
-        payload = {
-            "chat_id": chat_id,
-            "photo": photo_data,
-            "caption": caption
-        }
-    
-    response = requests.post(url, json=payload)
-    print(f"Telegram photo send response: {response.status_code}")
-    return response
-
-
-def send_menu(chat_id):
-    url = f"{TELEGRAM_API_URL}/sendMessage"
     payload = {
         "chat_id": chat_id,
-        "text": "👋 Bienvenue sur GeminiArtBot ! Que veux-tu faire ?",
-        "reply_markup": {
-            "inline_keyboard": [
-                [
-                    {"text": "✍️ Prompt texte", "callback_data": "prompt_text"},
-                    {"text": "📸 Photo", "callback_data": "prompt_photo"}
-                ],
-                [
-                    {"text": "🎁 Crédits", "callback_data": "check_credits"},
-                    {"text": "💳 Acheter", "callback_data": "buy_credits"}
-                ],
-                [
-                    {"text": "ℹ️ À propos", "callback_data": "about_bot"}
-                ]
-            ]
-        }
+        "photo": photo_data,
+        "caption": caption
     }
-    requests.post(url, json=payload)
+    sender.enqueue("sendPhoto", payload, chat_id)
+
+
+def send_menu(chat_id, language=DEFAULT_LANGUAGE):
+    send_catalog_message(chat_id, "menu", language)
 
 
 def answer_callback(callback_query_id):
-    url = f"{TELEGRAM_API_URL}/answerCallbackQuery"
     payload = {"callback_query_id": callback_query_id}
-    requests.post(url, json=payload)
+    sender.enqueue("answerCallbackQuery", payload, priority=True, ttl=CALLBACK_ANSWER_TTL)
 
 
 def get_user(user_id):
@@ -95,7 +478,7 @@ def get_user(user_id):
     return users[0] if users else None
 
 
-def create_user(user_id):
+def create_user(user_id, language=DEFAULT_LANGUAGE):
     headers = {
         "apikey": SUPABASE_KEY,
         "Authorization": f"Bearer {SUPABASE_KEY}",
@@ -105,7 +488,7 @@ def create_user(user_id):
     payload = {
         "id": user_id,
         "credits": 3,
-        "language": "en"
+        "language": language
     }
     response = requests.post(
         f"{SUPABASE_API_URL}/users",
@@ -291,28 +674,18 @@ def webhook():
         chat_id = callback['message']['chat']['id']
         user_id = callback['from']['id']
         callback_data = callback['data']
+        language = resolve_language(callback['from'])
 
-        if callback_data == 'prompt_text':
-            send_telegram_message(chat_id, "✍️ Envoie-moi ton prompt texte !")
-        elif callback_data == 'prompt_photo':
-            send_telegram_message(chat_id, "📸 Envoie-moi une photo maintenant.")
-        elif callback_data == 'check_credits':
+        if callback_data == 'check_credits':
             user = get_user(user_id)
             if not user:
-                user = create_user(user_id)
+                user = create_user(user_id, language)
             if user:
-                send_telegram_message(chat_id, f"🎁 Tu as *{user['credits']} crédit(s)* disponibles.")
+                send_catalog_message(chat_id, 'check_credits', language, credits=user['credits'])
             else:
-                send_telegram_message(chat_id, "❌ Erreur de création du compte. Réessaie plus tard.")
-        elif callback_data == 'buy_credits':
-            send_telegram_message(chat_id, "💳 Paiement bientôt disponible via Stripe/Telegram.")
-        elif callback_data == 'about_bot':
-            send_telegram_message(
-                chat_id,
-                "🤖 *GeminiArtBot* est un générateur d'images IA propulsé par Gemini 2.5 Flash et OpenRouter.\n\n"
-                "✨ Envoie un prompt texte pour générer une image !\n\n"
-                "💡 Chaque génération coûte 1 crédit."
-            )
+                send_catalog_message(chat_id, 'account_error', language)
+        elif callback_data in ('prompt_text', 'prompt_photo', 'buy_credits', 'about_bot'):
+            send_catalog_message(chat_id, callback_data, language)
 
         answer_callback(callback['id'])
         return 'OK', 200
@@ -328,52 +701,38 @@ def webhook():
         return 'OK', 200
 
     text = message['text']
+    language = resolve_language(message['from'])
 
     if text.startswith('/start'):
         user = get_user(user_id)
 
         if not user:
-            user = create_user(user_id)
-            send_telegram_message(
-                chat_id,
-                "✨ *Compte créé !*\n\nTu as reçu *3 crédits gratuits* pour générer des images IA."
-            )
+            user = create_user(user_id, language)
+            send_catalog_message(chat_id, 'account_created', language)
 
-        send_menu(chat_id)
+        send_menu(chat_id, language)
 
     elif text.startswith('/credits'):
         user = get_user(user_id)
         if not user:
-            user = create_user(user_id)
+            user = create_user(user_id, language)
         if user:
-            send_telegram_message(
-                chat_id,
-                f"💳 Tu as *{user['credits']} crédits* disponibles."
-            )
+            send_catalog_message(chat_id, 'credits', language, credits=user['credits'])
         else:
-            send_telegram_message(
-                chat_id,
-                "❌ Erreur de création du compte. Réessaie plus tard."
-            )
+            send_catalog_message(chat_id, 'account_error', language)
 
     else:
         user = get_user(user_id)
 
         if not user:
-            send_telegram_message(
-                chat_id,
-                "❌ Utilise /start pour t'inscrire d'abord."
-            )
+            send_catalog_message(chat_id, 'register_first', language)
             return 'OK', 200
 
         if user['credits'] <= 0:
-            send_telegram_message(
-                chat_id,
-                "⚠️ Tu n'as plus de crédits!"
-            )
+            send_catalog_message(chat_id, 'no_credits', language)
             return 'OK', 200
 
-        send_telegram_message(chat_id, "🎨 Génération en cours...")
+        send_status_message(chat_id, catalog.text('generating', language))
 
         image_data = generate_image(text)
 
@@ -392,14 +751,14 @@ def webhook():
                     new_credits = user['credits'] - 1
                     update_user_credits(user_id, new_credits)
                     save_prompt(user_id, text, "inline_base64")
-                    image_caption = f"✅ Image générée!\n\n💳 Crédits restants: *{new_credits}*"
+                    image_caption = catalog.text('generated', language, credits=new_credits)
                     send_telegram_photo(chat_id, image_data_url, image_caption)
                     return 'OK', 200
 
                 if data_type == "url":
                     image_url = image_data.get("data")
                     if image_url:
-                        send_telegram_message(chat_id, "📥 Téléchargement de l'image...")
+                        send_status_message(chat_id, catalog.text('downloading', language))
                         image_base64 = download_and_encode_image(image_url)
 
                         if image_base64:
@@ -407,26 +766,20 @@ def webhook():
                             new_credits = user['credits'] - 1
                             update_user_credits(user_id, new_credits)
                             save_prompt(user_id, text, image_url)
-                            image_caption = f"✅ Image générée!\n\n💳 Crédits restants: *{new_credits}*"
+                            image_caption = catalog.text('generated', language, credits=new_credits)
                             send_telegram_photo(chat_id, image_data_url, image_caption)
                             return 'OK', 200
 
-                        send_telegram_message(
-                            chat_id,
-                            "❌ Erreur lors du téléchargement de l'image. Réessaie plus tard."
-                        )
+                        send_catalog_message(chat_id, 'download_error', language)
                         return 'OK', 200
 
                 print(f"Unsupported image payload: {image_data}")
-                send_telegram_message(
-                    chat_id,
-                    "❌ Le format de l'image générée n'est pas supporté pour le moment."
-                )
+                send_catalog_message(chat_id, 'unsupported_format', language)
                 return 'OK', 200
 
             # Fallback if generate_image returned a URL string
             if isinstance(image_data, str):
-                send_telegram_message(chat_id, "📥 Téléchargement de l'image...")
+                send_status_message(chat_id, catalog.text('downloading', language))
                 image_base64 = download_and_encode_image(image_data)
 
                 if image_base64:
@@ -434,21 +787,15 @@ def webhook():
                     new_credits = user['credits'] - 1
                     update_user_credits(user_id, new_credits)
                     save_prompt(user_id, text, image_data)
-                    image_caption = f"✅ Image générée!\n\n💳 Crédits restants: *{new_credits}*"
+                    image_caption = catalog.text('generated', language, credits=new_credits)
                     send_telegram_photo(chat_id, image_data_url, image_caption)
                     return 'OK', 200
 
-                send_telegram_message(
-                    chat_id,
-                    "❌ Erreur lors du téléchargement de l'image. Réessaie plus tard."
-                )
+                send_catalog_message(chat_id, 'download_error', language)
                 return 'OK', 200
 
         else:
-            send_telegram_message(
-                chat_id,
-                "❌ Erreur lors de la génération. Réessaie avec un prompt différent."
-            )
+            send_catalog_message(chat_id, 'generation_error', language)
 
     return 'OK', 200
 
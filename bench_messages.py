@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of the per-update CPU cost of command/callback traffic
+"""
+import json
+import time
+
+import app
+
+ITERATIONS = 20000
+
+FAKE_USER = {"id": 42, "credits": 5, "language": "fr"}
+
+UPDATES = {
+    "/start": {"message": {"chat": {"id": 42}, "from": {"id": 42, "language_code": "fr"}, "text": "/start"}},
+    "/credits": {"message": {"chat": {"id": 42}, "from": {"id": 42, "language_code": "fr"}, "text": "/credits"}},
+    "about_bot": {"callback_query": {"id": "1", "data": "about_bot", "message": {"chat": {"id": 42}}, "from": {"id": 42, "language_code": "fr"}}},
+    "check_credits": {"callback_query": {"id": "1", "data": "check_credits", "message": {"chat": {"id": 42}}, "from": {"id": 42, "language_code": "fr"}}},
+}
+
+
+def legacy_menu(chat_id):
+    """Payload as send_menu() used to build it on every /start"""
+    texts = app.MESSAGES["fr"]
+    payload = {
+        "chat_id": chat_id,
+        "text": texts["menu"],
+        "reply_markup": {
+            "inline_keyboard": [
+                [
+                    {"text": texts["menu_prompt_text"], "callback_data": "prompt_text"},
+                    {"text": texts["menu_prompt_photo"], "callback_data": "prompt_photo"}
+                ],
+                [
+                    {"text": texts["menu_check_credits"], "callback_data": "check_credits"},
+                    {"text": texts["menu_buy_credits"], "callback_data": "buy_credits"}
+                ],
+                [
+                    {"text": texts["menu_about_bot"], "callback_data": "about_bot"}
+                ]
+            ]
+        }
+    }
+    return json.dumps(payload).encode()
+
+
+def legacy_message(chat_id, text):
+    """Payload as the former send_telegram_message() built it, encoded like requests' json="""
+    return json.dumps({"chat_id": chat_id, "text": text, "parse_mode": "Markdown"}).encode()
+
+
+def measure(func):
+    """CPU microseconds per call"""
+    start = time.process_time()
+    for i in range(ITERATIONS):
+        func(i)
+    return (time.process_time() - start) / ITERATIONS * 1e6
+
+
+def bench_payloads():
+    credits_text = app.MESSAGES["fr"]["credits"]
+    cases = {
+        "menu": (
+            legacy_menu,
+            lambda i: app.catalog.render("menu", "fr", i),
+        ),
+        "about_bot": (
+            lambda i: legacy_message(i, app.MESSAGES["fr"]["about_bot"]),
+            lambda i: app.catalog.render("about_bot", "fr", i),
+        ),
+        "credits": (
+            lambda i: legacy_message(i, credits_text.format(credits=i % 10)),
+            lambda i: app.catalog.render("credits", "fr", i, credits=i % 10),
+        ),
+    }
+    print(f"{'payload':<16}{'dict+json (µs)':>16}{'catalog (µs)':>16}{'gain':>8}")
+    for name, (legacy, catalog) in cases.items():
+        before = measure(legacy)
+        after = measure(catalog)
+        print(f"{name:<16}{before:>16.2f}{after:>16.2f}{before / after:>7.1f}x")
+
+
+def bench_webhook():
+    # Keep Supabase and Telegram out of the measurement
+    app.get_user = lambda user_id: FAKE_USER
+    app.sender.enqueue = lambda *args, **kwargs: None
+    client = app.app.test_client()
+
+    print(f"{'update':<16}{'webhook (µs)':>16}")
+    for name, update in UPDATES.items():
+        cost = measure(lambda i: client.post("/webhook", json=update))
+        print(f"{name:<16}{cost:>16.2f}")
+
+
+if __name__ == "__main__":
+    print("⏱️ Coût CPU par update (commandes et callbacks)")
+    print("=" * 56)
+    bench_payloads()
+    print("\n" + "=" * 56)
+    bench_webhook()
@@ -0,0 +1,71 @@
+"""
+Tests for the localized message catalog and the webhook's reply language
+"""
+import json
+
+import pytest
+
+import app
+
+
+@pytest.mark.parametrize("language", sorted(app.MESSAGES))
+def test_rendered_bodies_match_plain_json(language):
+    for key, template in app.MESSAGES[language].items():
+        if key.startswith("menu_"):
+            continue
+        body = json.loads(app.catalog.render(key, language, -100123, credits=7))
+        assert body["chat_id"] == -100123
+        assert body["text"] == template.format(credits=7)
+
+
+def test_menu_keyboard_is_localized():
+    body = json.loads(app.catalog.render("menu", "en", 1))
+    buttons = [button for row in body["reply_markup"]["inline_keyboard"] for button in row]
+    assert [button["callback_data"] for button in buttons] == [
+        "prompt_text", "prompt_photo", "check_credits", "buy_credits", "about_bot"
+    ]
+    assert buttons[-1]["text"] == app.MESSAGES["en"]["menu_about_bot"]
+
+
+def test_parse_mode_only_on_markdown_messages():
+    for key in app.MESSAGES["fr"]:
+        if key.startswith("menu_") and key != "menu":
+            continue
+        body = json.loads(app.catalog.render(key, "fr", 1, credits=1))
+        assert ("parse_mode" in body) == (key in app.MARKDOWN_MESSAGES), key
+
+
+@pytest.mark.parametrize("language_code, expected", [
+    ("fr", "fr"),
+    ("fr-CA", "fr"),
+    ("en", "en"),
+    ("de", "fr"),
+    (None, "fr"),
+])
+def test_resolve_language(language_code, expected):
+    assert app.resolve_language({"id": 1, "language_code": language_code}) == expected
+
+
+@pytest.fixture
+def replies(monkeypatch):
+    """Capture catalog sends and serve a legacy user row stored as 'en'"""
+    sent = []
+    monkeypatch.setattr(app, "get_user", lambda user_id: {"id": user_id, "credits": 2, "language": "en"})
+    monkeypatch.setattr(app, "answer_callback", lambda callback_query_id: None)
+    monkeypatch.setattr(app, "send_catalog_message",
+                        lambda chat_id, key, language=app.DEFAULT_LANGUAGE, **fields: sent.append((key, language)))
+    return sent
+
+
+def test_one_language_for_every_reply(replies):
+    client = app.app.test_client()
+    sender = {"id": 5, "language_code": "fr"}
+    client.post("/webhook", json={"message": {"chat": {"id": 5}, "from": sender, "text": "/start"}})
+    client.post("/webhook", json={"message": {"chat": {"id": 5}, "from": sender, "text": "/credits"}})
+    for data in ("about_bot", "check_credits", "prompt_text"):
+        client.post("/webhook", json={"callback_query": {
+            "id": "q", "data": data, "from": sender, "message": {"chat": {"id": 5}}
+        }})
+
+    assert [key for key, _ in replies] == ["menu", "credits", "about_bot", "check_credits", "prompt_text"]
+    assert {language for _, language in replies} == {"fr"}
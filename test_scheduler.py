@@ -0,0 +1,215 @@
+"""
+Tests for the outbound Telegram send scheduler (requests.post is patched)
+"""
+import time
+
+import pytest
+
+import app
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None):
+        self.status_code = status_code
+        self.body = body if body is not None else {"ok": True, "result": {"message_id": 1}}
+        self.text = str(self.body)
+
+    def json(self):
+        return self.body
+
+
+class FakeTelegram:
+    """Records every call and replays queued responses (200 by default)"""
+
+    def __init__(self):
+        self.calls = []
+        self.responses = []
+
+    def __call__(self, url, json=None, data=None, headers=None, timeout=None):
+        self.calls.append((url.rsplit("/", 1)[1], json if json is not None else data))
+        response = self.responses.pop(0) if self.responses else FakeResponse()
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def telegram(monkeypatch):
+    fake = FakeTelegram()
+    monkeypatch.setattr(app.requests, "post", fake)
+    return fake
+
+
+def make_scheduler(**kwargs):
+    """Scheduler without worker threads, driven by step()"""
+    kwargs.setdefault("global_rate", 1000)
+    kwargs.setdefault("chat_interval", 0)
+    return app.TelegramSendScheduler(threads=0, **kwargs)
+
+
+def step(scheduler):
+    """Send the next ready job synchronously, returns it (or None)"""
+    with scheduler.cond:
+        job, _ = scheduler._next_job(time.monotonic())
+        if job is None:
+            return None
+        payload = scheduler._dispatch(job)
+    delay, flood = scheduler._send(job, payload)
+    with scheduler.cond:
+        scheduler._complete(job, delay, flood)
+    return job
+
+
+def test_token_bucket_allows_burst_then_waits():
+    bucket = app.TokenBucket(rate=10, capacity=2)
+    now = bucket.updated
+    bucket.consume(now)
+    bucket.consume(now)
+    assert bucket.wait_time(now) == pytest.approx(0.1)
+    assert bucket.wait_time(now + 0.1) == 0
+
+
+def test_global_rate_limits_next_job(telegram):
+    scheduler = make_scheduler(global_rate=1)
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "a"}, 1)
+    scheduler.enqueue("sendMessage", {"chat_id": 2, "text": "b"}, 2)
+    assert step(scheduler) is not None
+    job, wait = scheduler._next_job(time.monotonic())
+    assert job is None
+    assert wait > 0.9
+
+
+def test_chats_are_served_round_robin(telegram):
+    scheduler = make_scheduler()
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "1a"}, 1)
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "1b"}, 1)
+    scheduler.enqueue("sendMessage", {"chat_id": 2, "text": "2a"}, 2)
+    while step(scheduler):
+        pass
+    assert [payload["text"] for _, payload in telegram.calls] == ["1a", "2a", "1b"]
+
+
+def test_per_chat_interval_and_in_flight_gating(telegram):
+    scheduler = make_scheduler(chat_interval=1)
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "1a"}, 1)
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "1b"}, 1)
+    scheduler.enqueue("sendMessage", {"chat_id": 2, "text": "2a"}, 2)
+    with scheduler.cond:
+        first, _ = scheduler._next_job(time.monotonic())
+        scheduler._dispatch(first)
+        # Chat 1 still has a call in flight, so chat 2 goes next
+        second, _ = scheduler._next_job(time.monotonic())
+        assert second.payload["text"] == "2a"
+        scheduler._dispatch(second)
+        scheduler._complete(first, None, False)
+        scheduler._complete(second, None, False)
+        job, wait = scheduler._next_job(time.monotonic())
+    assert job is None
+    assert 0.5 < wait <= 1
+
+
+def test_flood_reply_requeues_job_at_head(telegram):
+    scheduler = make_scheduler()
+    telegram.responses.append(FakeResponse(429, {"ok": False, "parameters": {"retry_after": 5}}))
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "1a"}, 1)
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "1b"}, 1)
+    scheduler.enqueue("sendMessage", {"chat_id": 2, "text": "2a"}, 2)
+    step(scheduler)
+
+    assert [job.payload["text"] for job in scheduler.chats[1]] == ["1a", "1b"]
+    assert next(iter(scheduler.chats)) == 1
+    assert scheduler.chat_ready_at[1] > time.monotonic() + 4
+    # Other chats are not held back by chat 1's flood limit
+    assert step(scheduler).payload["text"] == "2a"
+    assert step(scheduler) is None
+
+
+def test_status_messages_are_coalesced_into_edits(telegram):
+    scheduler = make_scheduler()
+    telegram.responses.append(FakeResponse(200, {"ok": True, "result": {"message_id": 77}}))
+    scheduler.enqueue_status(1, "generating")
+    scheduler.enqueue_status(1, "downloading")
+    step(scheduler)
+    scheduler.enqueue_status(1, "still downloading")
+    step(scheduler)
+
+    assert telegram.calls == [
+        ("sendMessage", {"chat_id": 1, "text": "downloading", "parse_mode": "Markdown"}),
+        ("editMessageText", {"chat_id": 1, "text": "still downloading", "parse_mode": "Markdown", "message_id": 77}),
+    ]
+
+
+def test_status_edit_falls_back_to_send_without_message_id(telegram):
+    scheduler = make_scheduler()
+    telegram.responses.append(FakeResponse(400, {"ok": False}))
+    scheduler.enqueue_status(1, "generating")
+    step(scheduler)
+    scheduler.enqueue_status(1, "downloading")
+    step(scheduler)
+
+    method, payload = telegram.calls[-1]
+    assert method == "sendMessage"
+    assert "message_id" not in payload
+
+
+def test_regular_message_ends_status_line(telegram):
+    scheduler = make_scheduler()
+    scheduler.enqueue_status(1, "generating")
+    step(scheduler)
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "done"}, 1)
+    scheduler.enqueue_status(1, "generating")
+    while step(scheduler):
+        pass
+    assert [method for method, _ in telegram.calls] == ["sendMessage", "sendMessage", "sendMessage"]
+
+
+def test_callback_answers_go_first(telegram):
+    scheduler = make_scheduler()
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "a"}, 1)
+    scheduler.enqueue("answerCallbackQuery", {"callback_query_id": "q"}, priority=True)
+    step(scheduler)
+    assert telegram.calls[0][0] == "answerCallbackQuery"
+
+
+def test_callback_network_error_does_not_stall_chats(telegram):
+    scheduler = make_scheduler()
+    telegram.responses.append(ConnectionError("boom"))
+    scheduler.enqueue("answerCallbackQuery", {"callback_query_id": "q"}, priority=True, ttl=10)
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "a"}, 1)
+    step(scheduler)
+
+    assert scheduler.global_ready_at == 0
+    assert step(scheduler).method == "sendMessage"
+    assert len(scheduler.priority) == 1
+
+
+def test_callback_flood_reply_pauses_everything(telegram):
+    scheduler = make_scheduler()
+    telegram.responses.append(FakeResponse(429, {"ok": False, "parameters": {"retry_after": 3}}))
+    scheduler.enqueue("answerCallbackQuery", {"callback_query_id": "q"}, priority=True, ttl=10)
+    scheduler.enqueue("sendMessage", {"chat_id": 1, "text": "a"}, 1)
+    step(scheduler)
+
+    assert scheduler.global_ready_at > time.monotonic() + 2
+    assert step(scheduler) is None
+
+
+def test_callback_answer_dropped_when_retry_comes_too_late(telegram):
+    scheduler = make_scheduler()
+    telegram.responses.append(ConnectionError("boom"))
+    scheduler.enqueue("answerCallbackQuery", {"callback_query_id": "q"}, priority=True, ttl=1)
+    step(scheduler)
+    assert not scheduler.priority
+
+
+def test_worker_pool_keeps_per_chat_order(telegram):
+    scheduler = app.TelegramSendScheduler(global_rate=1000, chat_interval=0, threads=3)
+    for i in range(5):
+        for chat_id in (1, 2, 3):
+            scheduler.enqueue("sendMessage", {"chat_id": chat_id, "text": str(i)}, chat_id)
+    scheduler.stop()
+
+    assert len(telegram.calls) == 15
+    for chat_id in (1, 2, 3):
+        texts = [payload["text"] for _, payload in telegram.calls if payload["chat_id"] == chat_id]
+        assert texts == ["0", "1", "2", "3", "4"]